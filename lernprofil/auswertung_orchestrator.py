@@ -15,9 +15,13 @@ Der Orchestrator respektiert die eigenständige Ordnerlogik der Module:
 - auswertung_visualize.py → erzeugt ./charts/TIMESTAMP/
 
 Der Orchestrator:
-1. Ruft Module mit minimalen Argumenten auf
+1. Ruft Module mit minimalen Argumenten auf (im eigenen Prozess,
+   mit --workers in persistenten Worker-Prozessen,
+   mit --isolate je Stage als separater Python-Prozess)
 2. Ermittelt die tatsächlichen Output-Locations
 3. Erstellt eine Session-Index-Datei mit Links zu allen Outputs
+4. Führt mit --workers/--isolate voneinander unabhängige Stages nebenläufig aus
+   (z.B. test + validation)
 
 QUICK START
 -----------
@@ -47,50 +51,228 @@ Nach Ausführung existieren:
     └── chronotype.png
 
 ./lernprofil_sessions/
-    └── session_20251127_143000.json   ← Session-Index mit Links
+    ├── session_20251127_143000_4711.json   ← Session-Index mit Links
+    └── session_20251127_143000_4711/       ← stdout/stderr-Logs der Stages
 
 Author: PK
 Version: 2.0
 Date: 2025-11
 """
 
-import argparse
-import json
-import subprocess
+# Nur leichtgewichtige Module auf Modulebene; argparse, asyncio, json,
+# hashlib, shutil und subprocess werden erst an der Stelle importiert, die
+# sie braucht - "--help" und interaktive Aufrufe zahlen so nicht für
+# ungenutzte Imports
+import atexit
+import functools
+import importlib
+import itertools
 import sys
 import os
 import re
-from dataclasses import dataclass, field
+import shlex
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+)
 
+if TYPE_CHECKING:
+    # Nur für Typannotationen; zur Laufzeit lazy importiert (siehe oben)
+    import asyncio
+    import subprocess
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: Any) -> str:
+    """Serialisiert Path-Objekte im Session-Index als String."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Nicht JSON-serialisierbar: {type(obj).__name__}")
+
+
+# mtime der Quelldatei in dem Stand, in dem ein Modul in diesen Prozess
+# geladen wurde - spätere Änderungen an der Datei wirken erst nach Neustart
+_LOADED_SOURCE_MTIMES: Dict[str, int] = {}
+
+
+def _note_loaded_modules(*names: str) -> None:
+    """Merkt sich für frisch geladene Module die mtime ihrer Quelldatei."""
+    for name in names:
+        module = sys.modules.get(name)
+        if module is not None and name not in _LOADED_SOURCE_MTIMES:
+            _LOADED_SOURCE_MTIMES[name] = os.stat(module.__file__).st_mtime_ns
+
+
+def _file_sha256(path: Path) -> bytes:
+    """SHA-256 einer Datei, blockweise gelesen statt komplett in den Speicher."""
+    import hashlib
+    
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):     # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').digest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+        return digest.digest()
+
+
+def _copy_atomic(src: Path, dst: Path) -> None:
+    """
+    Kopiert src nach dst über eine temporäre Datei und os.replace.
+    
+    Bewusst keine Hardlinks: auswertung.py überschreibt Dateien im
+    Timestamp-Ordner in-place, ein geteilter Inode würde den Cache verändern.
+    """
+    import shutil
+    
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+@dataclass(slots=True, frozen=True)
 class WorkflowConfig:
-    """Zentrale Konfiguration für alle Scripts"""
+    """Zentrale Konfiguration für alle Scripts (unveränderlich)"""
     csv_path: Path
     profile_id: Optional[str] = None
+    _resolved_csv_path: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        self.csv_path = Path(self.csv_path).expanduser().resolve()
+        # Auflösen (realpath) erst bei tatsächlicher Nutzung, siehe resolved_csv_path
+        # frozen: Normalisierung einmalig über object.__setattr__
+        object.__setattr__(self, 'csv_path', Path(self.csv_path).expanduser())
         
         # Profile-ID aus Dateinamen ableiten wenn nicht angegeben
         if self.profile_id is None:
-            self.profile_id = self.csv_path.stem
+            object.__setattr__(self, 'profile_id', self.csv_path.stem)
+    
+    @property
+    def has_csv(self) -> bool:
+        """False für Workflows ohne Eingabedatei (Platzhalter dummy.csv)."""
+        return self.csv_path.name != 'dummy.csv'
+    
+    @property
+    def resolved_csv_path(self) -> Path:
+        """Absoluter CSV-Pfad; wird beim ersten Zugriff aufgelöst und gemerkt."""
+        if self._resolved_csv_path is None:
+            object.__setattr__(self, '_resolved_csv_path', self.csv_path.resolve(strict=False))
+        return self._resolved_csv_path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StageResult:
-    """Ergebnis einer Workflow-Stage"""
+    """Ergebnis einer Workflow-Stage (unveränderlich, Ergänzungen via replace())"""
     stage_name: str
     success: bool
     duration_seconds: float
     output_dir: Optional[Path] = None
-    output_files: List[Path] = field(default_factory=list)
+    output_files: Tuple[Path, ...] = ()
     error_message: Optional[str] = None
-    stdout: str = ""
-    stderr: str = ""
+    stdout_path: Optional[Path] = None
+    stderr_path: Optional[Path] = None
+
+
+class WorkerPool:
+    """
+    Hält pro Script einen langlebigen Worker-Prozess (auswertung_worker.py).
+    
+    Interpreter-Start und Modul-Imports fallen nur beim ersten Job eines
+    Scripts an; ein Crash bleibt trotzdem auf den Worker beschränkt.
+    """
+    
+    def __init__(self, script_dir: Path, env: Dict[str, str]):
+        self.worker_script = script_dir / 'auswertung_worker.py'
+        self.env = env
+        self._workers: Dict[str, "subprocess.Popen"] = {}
+        # mtime des Scripts beim Start des jeweiligen Workers
+        self._source_mtimes: Dict[str, int] = {}
+        atexit.register(self.shutdown)
+    
+    def _get_worker(self, script_key: str, script_path: Path) -> "subprocess.Popen":
+        """Liefert den laufenden Worker für ein Script, startet ihn bei Bedarf."""
+        import subprocess
+        
+        worker = self._workers.get(script_key)
+        if worker is None or worker.poll() is not None:
+            self._source_mtimes[script_key] = script_path.stat().st_mtime_ns
+            worker = subprocess.Popen(
+                [sys.executable, '-u', str(self.worker_script), script_key, str(script_path)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',
+                env=self.env
+            )
+            self._workers[script_key] = worker
+        return worker
+    
+    def submit(self, script_key: str, script_path: Path, argv: List[str],
+               stdout_path: Path, stderr_path: Path) -> int:
+        """
+        Schickt einen Job an den Worker und wartet auf den Returncode.
+        
+        Der Worker schreibt stdout/stderr des Jobs direkt in die Log-Dateien.
+        """
+        import json
+        
+        worker = self._get_worker(script_key, script_path)
+        job = {'argv': argv, 'stdout': str(stdout_path), 'stderr': str(stderr_path)}
+        
+        try:
+            worker.stdin.write(json.dumps(job) + '\n')
+            worker.stdin.flush()
+            line = worker.stdout.readline()
+        except (BrokenPipeError, ValueError):
+            line = ''
+        
+        if not line:
+            returncode = worker.wait()
+            # Nach Timeout hat kill() den Worker schon entfernt; ein inzwischen
+            # gestarteter Ersatz-Worker darf hier nicht verloren gehen
+            if self._workers.get(script_key) is worker:
+                del self._workers[script_key]
+            with stderr_path.open('a', encoding='utf-8') as f:
+                f.write(f"Worker '{script_key}' beendet (Exit-Code {returncode})\n")
+            return returncode or 1
+        
+        return json.loads(line)['returncode']
+    
+    def loaded_source_mtime(self, script_key: str) -> Optional[int]:
+        """mtime des Scripts, mit dem der laufende Worker gestartet wurde (None ohne Worker)."""
+        worker = self._workers.get(script_key)
+        if worker is None or worker.poll() is not None:
+            return None
+        return self._source_mtimes.get(script_key)
+    
+    def kill(self, script_key: str) -> None:
+        """Beendet einen Worker hart, z.B. nach Timeout oder Abbruch."""
+        worker = self._workers.pop(script_key, None)
+        if worker is not None and worker.poll() is None:
+            worker.kill()
+            worker.wait()
+    
+    def shutdown(self) -> None:
+        """Beendet alle Worker; geschlossenes stdin ist das Stop-Signal."""
+        import subprocess
+        
+        for script_key, worker in list(self._workers.items()):
+            try:
+                worker.stdin.close()
+                worker.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                worker.kill()
+            self._workers.pop(script_key, None)
 
 
 class LernprofilOrchestrator:
@@ -100,6 +282,8 @@ class LernprofilOrchestrator:
     Respektiert die eigenständige Ordnerlogik der Module.
     """
     
+    # Der Text-Report (bericht.txt) entsteht in der compute-Stage selbst und
+    # wird dort in output_files erfasst - eine eigene Stage dafür gibt es nicht
     WORKFLOWS: Dict[str, List[str]] = {
         'minimal': ['compute'],
         'basic': ['compute'],
@@ -107,9 +291,41 @@ class LernprofilOrchestrator:
         'validate': ['test', 'validation']
     }
     
-    def __init__(self, config: WorkflowConfig, timeout: int = 300):
+    # Datenabhängigkeiten zwischen Stages; Stages ohne gegenseitige
+    # Abhängigkeit laufen nebenläufig
+    STAGE_DEPENDENCIES: Dict[str, List[str]] = {
+        'compute': [],
+        'visualize': ['compute'],
+        'test': [],
+        'validation': []
+    }
+    
+    # Stage-Name → Methode; zugleich die Liste aller gültigen Stages
+    _STAGE_METHODS: Dict[str, str] = {
+        'compute': '_stage_compute',
+        'visualize': '_stage_visualize',
+        'test': '_stage_test',
+        'validation': '_stage_validation'
+    }
+    
+    # Anzeigename je Stage (Konsole und Session-Index)
+    STAGE_LABELS: Dict[str, str] = {
+        'compute': 'Profil-Berechnung',
+        'visualize': 'Visualisierung',
+        'test': 'Unit-Tests',
+        'validation': 'Validierung'
+    }
+    
+    # Ergebnisdateien der compute-Stage, die im Cache abgelegt werden
+    COMPUTE_OUTPUTS = ('profil.json', 'bericht.txt')
+    
+    def __init__(self, config: WorkflowConfig, timeout: int = 300, isolate: bool = False,
+                 workers: bool = False, use_cache: bool = True):
         self.config = config
         self.timeout = timeout
+        self.isolate = isolate
+        self.workers = workers
+        self.use_cache = use_cache
         self.results: List[StageResult] = []
         self.session_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -119,22 +335,44 @@ class LernprofilOrchestrator:
             'auswertung': self.script_dir / 'auswertung.py',
             'visualize': self.script_dir / 'auswertung_visualize.py',
             'test': self.script_dir / 'auswertung_test.py',
-            'validation': self.script_dir / 'auswertung_validation.py'
+            'validation': self.script_dir / 'auswertung_validation.py',
+            'worker': self.script_dir / 'auswertung_worker.py'
         }
         
         # Tracking für Output-Locations
         self.profil_json_path: Optional[Path] = None
         self.report_txt_path: Optional[Path] = None
         self.charts_dir: Optional[Path] = None
+        self.session_dir: Optional[Path] = None
         
         self._validate_scripts()
+        
+        # Module werden beim ersten Aufruf importiert und bleiben danach geladen
+        if str(self.script_dir) not in sys.path:
+            sys.path.insert(0, str(self.script_dir))
+        
+        # Umgebung für Kindprozesse einmalig statt pro Stage kopieren
+        self._child_env = {**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+        
+        self._pool: Optional[WorkerPool] = (
+            WorkerPool(self.script_dir, self._child_env) if self.workers else None
+        )
+    
+    @staticmethod
+    @functools.cache
+    def _list_script_files(script_dir: Path) -> frozenset:
+        """Dateinamen im Script-Verzeichnis (ein scandir pro Verzeichnis und Prozess)."""
+        with os.scandir(script_dir) as entries:
+            return frozenset(e.name for e in entries if e.is_file())
     
     def _validate_scripts(self) -> None:
         """Prüft ob alle benötigten Scripts vorhanden sind"""
-        missing = []
-        for name, path in self.scripts.items():
-            if not path.exists():
-                missing.append(f"{name}: {path}")
+        present = self._list_script_files(self.script_dir)
+        missing = [
+            f"{name}: {path}"
+            for name, path in self.scripts.items()
+            if path.name not in present
+        ]
         
         if missing:
             print("❌ Fehlende Scripts:")
@@ -142,83 +380,236 @@ class LernprofilOrchestrator:
                 print(f"   {m}")
             raise FileNotFoundError("Erforderliche Scripts nicht gefunden")
     
-    def _run_subprocess(self, cmd: List[str], stage_name: str) -> StageResult:
+    async def _run_stage(self, script_key: str, argv: List[str], stage_name: str) -> StageResult:
+        """
+        Führt ein Script als Stage aus.
+        
+        Standardmäßig im Orchestrator-Prozess; mit workers=True in einem
+        persistenten Worker-Prozess, mit isolate=True in einem frischen
+        Python-Prozess (jeweils Crash-Isolation und Timeout).
+        """
+        # stdout/stderr gehen direkt in Log-Dateien statt in den Speicher
+        stdout_path = self.session_dir / f"{script_key}_stdout.txt"
+        stderr_path = self.session_dir / f"{script_key}_stderr.txt"
+        
+        if self.workers:
+            return await self._run_stage_worker(
+                script_key, argv, stage_name, stdout_path, stderr_path
+            )
+        if self.isolate:
+            cmd = [sys.executable, self.scripts[script_key], *argv]
+            return await self._run_subprocess(cmd, stage_name, stdout_path, stderr_path)
+        return await self._run_stage_inproc(
+            script_key, argv, stage_name, stdout_path, stderr_path
+        )
+    
+    def _finish_stage(self, stage_name: str, start_time: float, returncode: int,
+                      stdout_path: Path, stderr_path: Path) -> StageResult:
+        """Erzeugt das StageResult aus Returncode und Log-Dateien."""
+        duration = time.perf_counter() - start_time
+        
+        if returncode != 0:
+            # Nur die erste Zeile wird gebraucht - Log nicht komplett laden
+            with stderr_path.open('r', encoding='utf-8', errors='replace') as f:
+                error_msg = f.readline().rstrip('\n') or "Unknown error"
+            print(f"  ❌ {stage_name} fehlgeschlagen: {error_msg}")
+            return StageResult(
+                stage_name=stage_name,
+                success=False,
+                duration_seconds=duration,
+                error_message=error_msg,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path
+            )
+        
+        print(f"  ✓ {stage_name} erfolgreich ({duration:.1f}s)")
+        
+        return StageResult(
+            stage_name=stage_name,
+            success=True,
+            duration_seconds=duration,
+            stdout_path=stdout_path,
+            stderr_path=stderr_path
+        )
+    
+    def _iter_log_lines(self, path: Optional[Path]) -> Iterator[str]:
+        """Liest eine Log-Datei zeilenweise, ohne sie komplett zu laden."""
+        if path is None or not path.exists():
+            return
+        with path.open('r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                yield line.rstrip('\n')
+    
+    async def _run_stage_inproc(self, script_key: str, argv: List[str], stage_name: str,
+                                stdout_path: Path, stderr_path: Path) -> StageResult:
+        """
+        Führt ein Script im Orchestrator-Prozess aus und captured Output.
+        
+        Spart pro Stage den Interpreter-Start und den erneuten Import von
+        matplotlib/numpy. Ein Timeout ist hier nicht durchsetzbar.
+        """
+        start_time = time.perf_counter()
+        
+        print(f"\n{'─'*60}")
+        print(f"▶ {stage_name}")
+        print(f"{'─'*60}")
+        print(f"  In-Process: {shlex.join([self.scripts[script_key].name, *argv])}")
+        
+        worker = importlib.import_module('auswertung_worker')
+        returncode = worker.run_job(
+            script_key, self.scripts[script_key], argv, stdout_path, stderr_path
+        )
+        # Stages importieren auswertung auch indirekt (z.B. die Tests)
+        _note_loaded_modules('auswertung')
+        
+        return self._finish_stage(stage_name, start_time, returncode, stdout_path, stderr_path)
+    
+    async def _run_stage_worker(self, script_key: str, argv: List[str], stage_name: str,
+                                stdout_path: Path, stderr_path: Path) -> StageResult:
         """
-        Führt einen Subprocess aus und captured Output.
+        Führt ein Script im persistenten Worker-Prozess des Scripts aus.
+        
+        Der blockierende Pipe-Roundtrip läuft im Thread-Pool, sodass
+        unabhängige Stages parallel in ihren Workern laufen.
         """
-        start_time = datetime.now()
+        import asyncio
+        
+        start_time = time.perf_counter()
         
         print(f"\n{'─'*60}")
         print(f"▶ {stage_name}")
         print(f"{'─'*60}")
-        print(f"  Command: {' '.join(str(c) for c in cmd)}")
+        print(f"  Worker: {shlex.join([self.scripts[script_key].name, *argv])}")
         
+        loop = asyncio.get_running_loop()
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                encoding='utf-8',
-                env={**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+            returncode = await asyncio.wait_for(
+                loop.run_in_executor(
+                    None, self._pool.submit,
+                    script_key, self.scripts[script_key], argv, stdout_path, stderr_path
+                ),
+                timeout=self.timeout
             )
-            
-            duration = (datetime.now() - start_time).total_seconds()
-            
-            if result.returncode != 0:
-                error_msg = result.stderr.splitlines()[0] if result.stderr else "Unknown error"
-                print(f"  ❌ Fehlgeschlagen: {error_msg}")
-                return StageResult(
-                    stage_name=stage_name,
-                    success=False,
-                    duration_seconds=duration,
-                    error_message=error_msg,
-                    stdout=result.stdout,
-                    stderr=result.stderr
-                )
-            
-            print(f"  ✓ Erfolgreich ({duration:.1f}s)")
-            
+        except asyncio.TimeoutError:
+            self._pool.kill(script_key)
+            duration = time.perf_counter() - start_time
+            error_msg = f"Timeout nach {self.timeout}s"
+            print(f"  ❌ {stage_name}: {error_msg}")
             return StageResult(
                 stage_name=stage_name,
-                success=True,
+                success=False,
                 duration_seconds=duration,
-                stdout=result.stdout,
-                stderr=result.stderr
+                error_message=error_msg,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path
             )
+        except asyncio.CancelledError:
+            # Die Antwort des laufenden Jobs darf nicht beim nächsten Job ankommen
+            self._pool.kill(script_key)
+            raise
+        
+        return self._finish_stage(stage_name, start_time, returncode, stdout_path, stderr_path)
+    
+    async def _run_subprocess(self, cmd: List[Union[str, os.PathLike]], stage_name: str,
+                              stdout_path: Path, stderr_path: Path) -> StageResult:
+        """
+        Führt einen Subprocess aus und leitet dessen Output in Log-Dateien.
+        
+        Der Subprocess schreibt direkt in die Dateien, der Orchestrator puffert
+        nichts. Die Event-Loop bleibt frei, sodass unabhängige Stages parallel
+        laufen können.
+        """
+        import asyncio
+        
+        start_time = time.perf_counter()
+        
+        print(f"\n{'─'*60}")
+        print(f"▶ {stage_name}")
+        print(f"{'─'*60}")
+        # Einmal in Strings umwandeln; dieselbe Liste dient zur Anzeige
+        # (korrekt gequotet, z.B. bei Leerzeichen im Pfad) und zum Aufruf
+        cmd_args = [os.fspath(c) for c in cmd]
+        print(f"  Command: {shlex.join(cmd_args)}")
+        
+        proc = None
+        try:
+            with stdout_path.open('wb') as out, stderr_path.open('wb') as err:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd_args,
+                    stdout=out,
+                    stderr=err,
+                    env=self._child_env
+                )
+                await asyncio.wait_for(proc.wait(), timeout=self.timeout)
             
-        except subprocess.TimeoutExpired:
-            duration = (datetime.now() - start_time).total_seconds()
+            return self._finish_stage(
+                stage_name, start_time, proc.returncode, stdout_path, stderr_path
+            )
+            
+        except asyncio.TimeoutError:
+            # Erst aufräumen, dann das Ergebnis bauen: ein Abbruch durch den
+            # Scheduler während des Aufräumens darf den Timeout nicht verdecken
+            await self._reap_process(proc)
+            duration = time.perf_counter() - start_time
             error_msg = f"Timeout nach {self.timeout}s"
-            print(f"  ❌ {error_msg}")
+            print(f"  ❌ {stage_name}: {error_msg}")
             return StageResult(
                 stage_name=stage_name,
                 success=False,
                 duration_seconds=duration,
-                error_message=error_msg
+                error_message=error_msg,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path
             )
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
-            print(f"  ❌ Fehler: {e}")
+            await self._reap_process(proc)
+            duration = time.perf_counter() - start_time
+            print(f"  ❌ {stage_name}: Fehler: {e}")
             return StageResult(
                 stage_name=stage_name,
                 success=False,
                 duration_seconds=duration,
                 error_message=str(e)
             )
+        finally:
+            # Bei Abbruch keinen verwaisten Prozess zurücklassen
+            await self._reap_process(proc)
+    
+    @staticmethod
+    async def _reap_process(proc: Optional["asyncio.subprocess.Process"]) -> None:
+        """
+        Beendet einen noch laufenden Prozess und wartet auf sein Ende.
+        
+        Das Warten ist gegen Abbruch geschützt: wird die Stage dabei
+        abgebrochen, wird trotzdem zu Ende gewartet und das Ergebnis der
+        Stage bleibt erhalten.
+        """
+        import asyncio
+        
+        if proc is None or proc.returncode is not None:
+            return
+        proc.kill()
+        waiter = asyncio.ensure_future(proc.wait())
+        while not waiter.done():
+            try:
+                await asyncio.shield(waiter)
+            except asyncio.CancelledError:
+                # Die Stage ist bereits beendet - nur noch den Prozess einsammeln
+                continue
     
     def _find_latest_subdir(self, base_dir: Path) -> Optional[Path]:
         """Findet das neueste Timestamp-Unterverzeichnis."""
         if not base_dir.exists():
             return None
         
-        subdirs = [d for d in base_dir.iterdir() if d.is_dir()]
-        if not subdirs:
-            return None
+        # Timestamp-Format sortiert chronologisch, der größte Name ist der neueste
+        with os.scandir(base_dir) as entries:
+            latest = max(
+                (e.name for e in entries if e.is_dir() and not e.name.startswith('.')),
+                default=None
+            )
         
-        # Sortiere nach Name (Timestamp-Format sortiert chronologisch)
-        subdirs.sort(key=lambda d: d.name, reverse=True)
-        return subdirs[0]
+        return base_dir / latest if latest else None
     
     def _parse_output_path_from_stdout(self, stdout: str, pattern: str) -> Optional[Path]:
         """Extrahiert einen Pfad aus stdout anhand eines Patterns."""
@@ -230,24 +621,84 @@ class LernprofilOrchestrator:
                     return Path(match.group(1).strip())
         return None
     
-    def _stage_compute(self) -> StageResult:
+    def _compute_cache_dir(self) -> Path:
+        """
+        Cache-Ordner der compute-Stage, adressiert über den Inhalt der Eingaben.
+        
+        Key: SHA-256 über den CSV-Hash, Stand von auswertung.py und Profil-ID.
+        Ändert sich eines davon, entsteht ein neuer Eintrag.
+        """
+        import hashlib
+        
+        key = hashlib.sha256()
+        key.update(_file_sha256(self.config.resolved_csv_path))
+        key.update(b'\0')
+        key.update(str(self._scoring_source_mtime()).encode())
+        key.update(b'\0')
+        key.update(self.config.profile_id.encode('utf-8'))
+        return Path.cwd() / "auswertung" / ".cache" / key.hexdigest()
+    
+    def _scoring_source_mtime(self) -> int:
+        """
+        mtime von auswertung.py in dem Stand, der die compute-Stage ausführt.
+        
+        Im In-Process-Modus und mit --workers läuft das zuvor geladene Modul,
+        auch wenn die Datei inzwischen geändert wurde; nur mit --isolate wird
+        die Datei bei jeder Stage neu gelesen.
+        """
+        loaded = None
+        if self.workers:
+            loaded = self._pool.loaded_source_mtime('auswertung')
+        elif not self.isolate:
+            _note_loaded_modules('auswertung')
+            loaded = _LOADED_SOURCE_MTIMES.get('auswertung')
+        if loaded is not None:
+            return loaded
+        return self.scripts['auswertung'].stat().st_mtime_ns
+    
+    def _restore_compute_cache(self, cache_dir: Path) -> StageResult:
+        """
+        Legt die gecachten Ergebnisse in einem neuen Timestamp-Ordner ab,
+        genau wie auswertung.py es selbst tun würde.
+        """
+        start_time = time.perf_counter()
+        
+        print(f"\n{'─'*60}")
+        print(f"▶ {self.STAGE_LABELS['compute']}")
+        print(f"{'─'*60}")
+        print(f"  Cache-Treffer: {cache_dir.name[:12]} (CSV und auswertung.py unverändert)")
+        
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        output_dir = Path.cwd() / "auswertung" / timestamp
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name in self.COMPUTE_OUTPUTS:
+            _copy_atomic(cache_dir / name, output_dir / name)
+        
+        duration = time.perf_counter() - start_time
+        print(f"  ✓ {self.STAGE_LABELS['compute']} erfolgreich ({duration:.1f}s, aus Cache)")
+        
+        return StageResult(
+            stage_name=self.STAGE_LABELS['compute'],
+            success=True,
+            duration_seconds=duration
+        )
+    
+    async def _stage_compute(self) -> StageResult:
         """
         Stage: Profil berechnen
         
         Ruft auswertung.py auf und ermittelt danach die Output-Location.
         Das Modul erstellt selbst einen Timestamp-Ordner unter ./auswertung/
-        """
-        cmd = [
-            sys.executable,
-            str(self.scripts['auswertung']),
-            str(self.config.csv_path),
-            '--id', self.config.profile_id,
-            '--output', 'profil.json',    # Modul nutzt nur Dateinamen
-            '--report', 'bericht.txt',    # und legt eigenen Ordner an
-            '--quiet'                      # Keine stdout-Duplikation
-        ]
         
-        result = self._run_subprocess(cmd, "Profil-Berechnung")
+        Bei unveränderter CSV, auswertung.py und Profil-ID werden die
+        Ergebnisse aus dem Cache übernommen, statt neu zu rechnen.
+        """
+        cache_dir = self._compute_cache_dir() if self.use_cache else None
+        if cache_dir and all((cache_dir / name).exists() for name in self.COMPUTE_OUTPUTS):
+            result = self._restore_compute_cache(cache_dir)
+            cache_dir = None    # Eintrag ist bereits vollständig
+        else:
+            result = await self._run_compute()
         
         if result.success:
             # Finde den neuesten Output-Ordner
@@ -255,27 +706,45 @@ class LernprofilOrchestrator:
             latest_dir = self._find_latest_subdir(auswertung_base)
             
             if latest_dir:
-                result.output_dir = latest_dir
-                
                 # Suche nach Output-Dateien
                 profil_json = latest_dir / "profil.json"
                 bericht_txt = latest_dir / "bericht.txt"
+                output_files = []
                 
                 if profil_json.exists():
                     self.profil_json_path = profil_json
-                    result.output_files.append(profil_json)
+                    output_files.append(profil_json)
                     print(f"  → JSON-Profil: {profil_json}")
                 
                 if bericht_txt.exists():
                     self.report_txt_path = bericht_txt
-                    result.output_files.append(bericht_txt)
+                    output_files.append(bericht_txt)
                     print(f"  → Text-Report: {bericht_txt}")
+                
+                result = replace(result, output_dir=latest_dir, output_files=tuple(output_files))
+                
+                if cache_dir and profil_json.exists() and bericht_txt.exists():
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    for name in self.COMPUTE_OUTPUTS:
+                        _copy_atomic(latest_dir / name, cache_dir / name)
             else:
                 print("  ⚠ Output-Verzeichnis nicht gefunden")
         
         return result
     
-    def _stage_visualize(self) -> StageResult:
+    async def _run_compute(self) -> StageResult:
+        """Führt auswertung.py für die konfigurierte CSV aus."""
+        argv = [
+            str(self.config.resolved_csv_path),
+            '--id', self.config.profile_id,
+            '--output', 'profil.json',    # Modul nutzt nur Dateinamen
+            '--report', 'bericht.txt',    # und legt eigenen Ordner an
+            '--quiet'                      # Keine stdout-Duplikation
+        ]
+        
+        return await self._run_stage('auswertung', argv, self.STAGE_LABELS['compute'])
+    
+    async def _stage_visualize(self) -> StageResult:
         """
         Stage: Visualisierungen erstellen
         
@@ -283,19 +752,15 @@ class LernprofilOrchestrator:
         """
         if not self.profil_json_path or not self.profil_json_path.exists():
             return StageResult(
-                stage_name="Visualisierung",
+                stage_name=self.STAGE_LABELS['visualize'],
                 success=False,
                 duration_seconds=0.0,
                 error_message="profil.json nicht gefunden (Stage compute fehlgeschlagen?)"
             )
         
-        cmd = [
-            sys.executable,
-            str(self.scripts['visualize']),
-            str(self.profil_json_path)
-        ]
+        argv = [str(self.profil_json_path)]
         
-        result = self._run_subprocess(cmd, "Visualisierung")
+        result = await self._run_stage('visualize', argv, self.STAGE_LABELS['visualize'])
         
         if result.success:
             # Finde den neuesten Charts-Ordner
@@ -303,50 +768,51 @@ class LernprofilOrchestrator:
             latest_dir = self._find_latest_subdir(charts_base)
             
             if latest_dir:
-                result.output_dir = latest_dir
                 self.charts_dir = latest_dir
                 
                 # Liste alle generierten Dateien
-                for file in latest_dir.iterdir():
-                    if file.is_file():
-                        result.output_files.append(file)
-                        print(f"  → {file.name}")
+                with os.scandir(latest_dir) as entries:
+                    output_files = tuple(
+                        Path(entry.path) for entry in entries
+                        if entry.is_file(follow_symlinks=False)
+                    )
+                for path in output_files:
+                    print(f"  → {path.name}")
+                
+                result = replace(result, output_dir=latest_dir, output_files=output_files)
             else:
                 print("  ⚠ Charts-Verzeichnis nicht gefunden")
         
         return result
     
-    def _stage_test(self) -> StageResult:
+    async def _stage_test(self) -> StageResult:
         """Stage: Unit-Tests ausführen"""
-        cmd = [
-            sys.executable,
-            str(self.scripts['test'])
-        ]
-        
-        result = self._run_subprocess(cmd, "Unit-Tests")
+        result = await self._run_stage('test', [], self.STAGE_LABELS['test'])
         
         # Zeige Test-Zusammenfassung
-        if result.stdout:
-            for line in result.stdout.splitlines():
-                if 'TEST-ZUSAMMENFASSUNG' in line or line.startswith('Tests ') or line.startswith('Erfolgreich'):
-                    print(f"  {line}")
+        for line in self._iter_log_lines(result.stdout_path):
+            if 'TEST-ZUSAMMENFASSUNG' in line or line.startswith('Tests ') or line.startswith('Erfolgreich'):
+                print(f"  {line}")
         
-        return result
+        # Die Stage-Logs sind das Testprotokoll (unittest schreibt auf stderr,
+        # die Zusammenfassung auf stdout) - verlinken statt kopieren
+        return replace(
+            result,
+            output_files=tuple(p for p in (result.stdout_path, result.stderr_path) if p)
+        )
     
-    def _stage_validation(self) -> StageResult:
+    async def _stage_validation(self) -> StageResult:
         """Stage: Validierung ausführen"""
-        cmd = [
-            sys.executable,
-            str(self.scripts['validation'])
-        ]
-        
-        result = self._run_subprocess(cmd, "Validierung")
+        result = await self._run_stage('validation', [], self.STAGE_LABELS['validation'])
         
         # Zeige Validierungs-Status
-        if result.stdout:
-            for line in result.stdout.splitlines():
-                if '✅' in line or '❌' in line or 'PRODUCTION READY' in line:
-                    print(f"  {line}")
+        for line in self._iter_log_lines(result.stdout_path):
+            if '✅' in line or '❌' in line or 'PRODUCTION READY' in line:
+                print(f"  {line}")
+        
+        # Das stdout-Log ist das Validierungsprotokoll - verlinken statt kopieren
+        if result.stdout_path:
+            result = replace(result, output_files=(result.stdout_path,))
         
         return result
     
@@ -365,61 +831,204 @@ class LernprofilOrchestrator:
         print(f"Stages: {' → '.join(stages)}")
         self._show_config()
         
-        # Führe Stages aus
-        for stage in stages:
-            stage_method = getattr(self, f'_stage_{stage}', None)
-            if stage_method is None:
-                print(f"❌ Stage nicht implementiert: {stage}")
+        # Fail-fast: alle Stages auflösen, bevor eine davon startet
+        unknown = [stage for stage in stages if stage not in self._STAGE_METHODS]
+        if unknown:
+            raise KeyError(f"Stage nicht implementiert: {', '.join(unknown)}")
+        methods = {stage: getattr(self, self._STAGE_METHODS[stage]) for stage in stages}
+        
+        # Ergebnisse eines vorherigen Workflows nicht in diese Session übernehmen
+        self.results = []
+        self.profil_json_path = None
+        self.report_txt_path = None
+        self.charts_dir = None
+        
+        self.session_dir = self._create_session_dir()
+        
+        if 'compute' in stages and self.config.has_csv:
+            error = self._pre_validate_csv()
+            if error:
+                print(f"\n❌ CSV ungültig: {error}")
+                # Abgelehnte Läufe bleiben im Session-Index nachvollziehbar
+                self.results.append(StageResult(
+                    stage_name=self.STAGE_LABELS['compute'],
+                    success=False,
+                    duration_seconds=0.0,
+                    error_message=error
+                ))
+                self._write_session_index()
                 return False
+        
+        import asyncio
+        
+        success = asyncio.run(self._run_stages(methods))
+        
+        self._write_session_index()
+        if success:
+            self._print_final_summary()
+        return success
+    
+    def _pre_validate_csv(self) -> Optional[str]:
+        """
+        Prüft die CSV vor dem ersten Stage-Start (88 Items, Likert 1-5).
+        
+        Nutzt den Parser aus auswertung.py direkt im Orchestrator, sodass
+        fehlerhafte Dateien abgelehnt werden, bevor ein Subprocess oder
+        Worker gestartet wird.
+        
+        Returns:
+            Fehlermeldung oder None, wenn die CSV gültig ist
+        """
+        scoring = importlib.import_module('auswertung')
+        _note_loaded_modules('auswertung')
+        try:
+            scoring.load_ratings_from_csv(self.config.resolved_csv_path)
+        except Exception as exc:
+            # Auch unerwartete Parser-Fehler (z.B. Zeile ohne Rating-Spalte)
+            # als ungültige CSV melden statt mit Traceback abzubrechen
+            return str(exc) or type(exc).__name__
+        return None
+    
+    async def _run_stages(self, stages: Dict[str, Callable[[], Awaitable[StageResult]]]) -> bool:
+        """
+        Startet jede Stage, sobald ihre Abhängigkeiten erfolgreich waren.
+        
+        Args:
+            stages: Stage-Name → Stage-Methode, in Workflow-Reihenfolge
+        
+        Beim ersten Fehlschlag werden noch laufende Stages abgebrochen.
+        """
+        import asyncio
+        
+        order = list(stages)
+        pending = list(order)
+        completed: set = set()
+        running: Dict[asyncio.Task, str] = {}
+        
+        while pending or running:
+            for stage in list(pending):
+                deps = [d for d in self.STAGE_DEPENDENCIES.get(stage, []) if d in stages]
+                if all(d in completed for d in deps):
+                    pending.remove(stage)
+                    task = asyncio.create_task(stages[stage]())
+                    running[task] = stage
             
-            result = stage_method()
-            self.results.append(result)
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
             
-            if not result.success:
-                print(f"\n❌ Workflow abgebrochen: {result.stage_name} fehlgeschlagen")
-                self._write_session_index()
+            # Erst alle fertigen Ergebnisse erfassen (in Workflow-Reihenfolge),
+            # dann über den Abbruch entscheiden - sonst fehlen sie im Session-Index
+            failed = []
+            for task in sorted(finished, key=lambda t: order.index(running[t])):
+                stage = running.pop(task)
+                result = self._task_result(task, self.STAGE_LABELS[stage])
+                self.results.append(result)
+                
+                if result.success:
+                    completed.add(stage)
+                else:
+                    failed.append(result)
+            
+            if failed:
+                print(f"\n❌ Workflow abgebrochen: {failed[0].stage_name} fehlgeschlagen")
+                for other in running:
+                    other.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                # Auch abgebrochene Stages erscheinen im Session-Index
+                for task in sorted(running, key=lambda t: order.index(running[t])):
+                    self.results.append(
+                        self._task_result(task, self.STAGE_LABELS[running[task]])
+                    )
                 return False
         
-        self._write_session_index()
-        self._print_final_summary()
         return True
     
-    def _write_session_index(self) -> None:
+    @staticmethod
+    def _task_result(task: "asyncio.Task", stage_name: str) -> StageResult:
+        """Ergebnis einer beendeten Stage-Task; Abbruch und Exceptions werden zum Fehlschlag."""
+        if task.cancelled():
+            return StageResult(
+                stage_name=stage_name,
+                success=False,
+                duration_seconds=0.0,
+                error_message="Abgebrochen nach Fehlschlag einer anderen Stage"
+            )
+        try:
+            return task.result()
+        except Exception as e:
+            print(f"  ❌ {stage_name}: Fehler: {e}")
+            return StageResult(
+                stage_name=stage_name,
+                success=False,
+                duration_seconds=0.0,
+                error_message=f"{type(e).__name__}: {e}"
+            )
+    
+    def _create_session_dir(self) -> Path:
         """
-        Schreibt Session-Index als JSON.
+        Legt den Ordner für die Stage-Logs dieser Session an.
         
-        Der Index verweist auf die tatsächlichen Output-Locations der Module.
+        mkdir ohne exist_ok ist atomar: parallele Orchestratoren (PID im Namen)
+        und wiederholte Workflows (Zähler) bekommen garantiert eigene Ordner.
         """
         sessions_dir = Path.cwd() / "lernprofil_sessions"
         sessions_dir.mkdir(parents=True, exist_ok=True)
         
+        base = f"session_{self.session_timestamp}_{os.getpid()}"
+        for i in itertools.count():
+            candidate = sessions_dir / (base if i == 0 else f"{base}_{i}")
+            try:
+                candidate.mkdir()
+                return candidate
+            except FileExistsError:
+                continue
+    
+    def _write_session_index(self) -> None:
+        """
+        Schreibt Session-Index als JSON.
+        
+        Der Index verweist auf die tatsächlichen Output-Locations der Module.
+        """
         index = {
-            'session_id': self.session_timestamp,
+            'session_id': self.session_dir.name,
             'timestamp': datetime.now().isoformat(),
             'config': {
-                'csv_path': str(self.config.csv_path),
+                'csv_path': self.config.resolved_csv_path if self.config.has_csv else None,
                 'profile_id': self.config.profile_id
             },
             'outputs': {
-                'profil_json': str(self.profil_json_path) if self.profil_json_path else None,
-                'report_txt': str(self.report_txt_path) if self.report_txt_path else None,
-                'charts_dir': str(self.charts_dir) if self.charts_dir else None
+                'profil_json': self.profil_json_path,
+                'report_txt': self.report_txt_path,
+                'charts_dir': self.charts_dir
             },
             'stages': [
                 {
                     'name': r.stage_name,
                     'success': r.success,
                     'duration_seconds': r.duration_seconds,
-                    'output_dir': str(r.output_dir) if r.output_dir else None,
-                    'output_files': [str(f) for f in r.output_files],
+                    'output_dir': r.output_dir,
+                    'output_files': r.output_files,
+                    'stdout_log': r.stdout_path,
+                    'stderr_log': r.stderr_path,
                     'error_message': r.error_message
                 }
                 for r in self.results
             ]
         }
         
-        index_path = sessions_dir / f"session_{self.session_timestamp}.json"
-        index_path.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding='utf-8')
+        # Index liegt neben dem gleichnamigen Log-Ordner der Session
+        index_path = self.session_dir.with_suffix('.json')
+        # Path-Objekte werden erst beim Serialisieren über _json_default zu Strings
+        if ORJSON_AVAILABLE:
+            index_path.write_bytes(
+                orjson.dumps(index, default=_json_default, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            import json
+            
+            index_path.write_text(
+                json.dumps(index, indent=2, ensure_ascii=False, default=_json_default),
+                encoding='utf-8'
+            )
         
         print(f"\n  Session-Index: {index_path}")
     
@@ -453,10 +1062,10 @@ class LernprofilOrchestrator:
         """Zeigt aktuelle Konfiguration"""
         print(f"\nKonfiguration:")
         
-        if self.config.csv_path.name == 'dummy.csv':
+        if not self.config.has_csv:
             print("  CSV:        (nicht verwendet)")
         else:
-            print(f"  CSV:        {self.config.csv_path}")
+            print(f"  CSV:        {self.config.resolved_csv_path}")
         
         print(f"  Profile-ID: {self.config.profile_id}")
     
@@ -551,6 +1160,8 @@ def interactive_setup() -> WorkflowConfig:
 
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Lernprofil-Orchestrator v2.0",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -560,6 +1171,8 @@ Beispiele:
   %(prog)s --csv antworten.csv --workflow basic      # Basic
   %(prog)s --csv antworten.csv --workflow full       # Mit Visualisierung
   %(prog)s --workflow validate                       # Nur Tests
+  %(prog)s --workflow validate --isolate             # Stages als Subprozesse
+  %(prog)s --workers                                 # Interaktiv, Worker bleiben warm
         """
     )
     
@@ -570,8 +1183,17 @@ Beispiele:
                        help='Workflow direkt ausführen')
     parser.add_argument('--id', dest='profile_id',
                        help='Profile-ID (Standard: CSV-Dateiname)')
-    parser.add_argument('--timeout', type=int, default=300,
-                       help='Timeout pro Stage (Standard: 300s)')
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                       help='Profil immer neu berechnen, auch bei unveränderter CSV')
+    parser.add_argument('--timeout', type=int,
+                       help='Timeout pro Stage in Sekunden (Standard: 300s); '
+                            'aktiviert --workers, falls nicht --isolate gesetzt ist')
+    execution = parser.add_mutually_exclusive_group()
+    execution.add_argument('--isolate', action='store_true',
+                       help='Jede Stage in eigenem Python-Prozess ausführen')
+    execution.add_argument('--workers', action='store_true',
+                       help='Stages in persistenten Worker-Prozessen ausführen '
+                            '(isoliert, ohne Neustart pro Stage)')
     
     args = parser.parse_args()
     
@@ -589,9 +1211,19 @@ Beispiele:
             profile_id=args.profile_id
         )
     
+    # In-Process-Stages lassen sich nicht abbrechen: Timeout braucht Worker
+    if args.timeout is not None and not (args.isolate or args.workers):
+        print("ℹ️  --timeout aktiviert --workers (Timeouts nur bei isolierten Stages)")
+        args.workers = True
+    if args.timeout is None:
+        args.timeout = 300
+    
     # Orchestrator starten
     try:
-        orchestrator = LernprofilOrchestrator(config, timeout=args.timeout)
+        orchestrator = LernprofilOrchestrator(
+            config, timeout=args.timeout, isolate=args.isolate, workers=args.workers,
+            use_cache=args.use_cache
+        )
     except FileNotFoundError as e:
         print(f"❌ {e}")
         return 1
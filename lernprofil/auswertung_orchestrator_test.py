@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Unit-Tests für auswertung_orchestrator.py
+
+Testet das Workflow-Verhalten des Orchestrators:
+- Abbruch-Pfad des Stage-Schedulers (alle Stages im Session-Index)
+- Cache der compute-Stage (Treffer, Fehlschlag, Key)
+- Session-Index bei wiederholten Workflows
+"""
+
+import asyncio
+import importlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Orchestrator-Modul importieren
+sys.path.insert(0, str(Path(__file__).parent))
+import auswertung_orchestrator as orchestrator
+
+EXAMPLE_CSV = Path(__file__).parent.parent / "examples" / "questionnaire_answered_example1.csv"
+
+
+class _WorkdirTestCase(unittest.TestCase):
+    """Führt jeden Test in einem leeren temporären Arbeitsverzeichnis aus."""
+
+    def setUp(self):
+        self._old_cwd = Path.cwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._old_cwd)
+        self._tmp.cleanup()
+
+    def _run_workflow(self, orch, workflow: str) -> bool:
+        """Führt einen Workflow ohne Konsolenausgabe aus."""
+        with redirect_stdout(io.StringIO()):
+            return orch.run_workflow(workflow)
+
+
+class TestStageScheduler(_WorkdirTestCase):
+    """Tests für den Abbruch-Pfad des Schedulers."""
+
+    def test_timeouts_of_parallel_stages_are_all_recorded(self):
+        """Teste, dass gleichzeitige Timeouts beide im Ergebnis landen (mit Anzeigenamen)."""
+        orch = orchestrator.LernprofilOrchestrator(
+            orchestrator.WorkflowConfig(csv_path=Path('dummy.csv')), timeout=0, isolate=True
+        )
+        self.assertFalse(self._run_workflow(orch, 'validate'))
+
+        results = {r.stage_name: r.error_message for r in orch.results}
+        self.assertEqual(results, {
+            'Unit-Tests': 'Timeout nach 0s',
+            'Validierung': 'Timeout nach 0s'
+        })
+
+    def test_cancelled_and_crashed_stages_are_recorded(self):
+        """Teste, dass abgebrochene und abgestürzte Stages als Fehlschlag erfasst werden."""
+
+        class Orchestrator(orchestrator.LernprofilOrchestrator):
+            async def _stage_test(self):
+                raise OSError("Platte voll")
+
+            async def _stage_validation(self):
+                await asyncio.sleep(60)
+
+        orch = Orchestrator(orchestrator.WorkflowConfig(csv_path=Path('dummy.csv')))
+        self.assertFalse(self._run_workflow(orch, 'validate'))
+
+        results = {r.stage_name: (r.success, r.error_message) for r in orch.results}
+        self.assertEqual(results, {
+            'Unit-Tests': (False, 'OSError: Platte voll'),
+            'Validierung': (False, 'Abgebrochen nach Fehlschlag einer anderen Stage')
+        })
+        # Session-Index wird trotz Abbruch geschrieben
+        self.assertTrue(orch.session_dir.with_suffix('.json').exists())
+
+
+class _CountingOrchestrator(orchestrator.LernprofilOrchestrator):
+    """Zählt, wie oft auswertung.py tatsächlich ausgeführt wird."""
+
+    compute_runs = 0
+
+    async def _run_compute(self):
+        type(self).compute_runs += 1
+        return await super()._run_compute()
+
+
+class TestComputeCache(_WorkdirTestCase):
+    """Tests für den Cache der compute-Stage."""
+
+    def setUp(self):
+        super().setUp()
+        _CountingOrchestrator.compute_runs = 0
+        self.csv_path = Path("antworten.csv")
+        self.csv_path.write_bytes(EXAMPLE_CSV.read_bytes())
+
+    def _run_basic(self) -> orchestrator.LernprofilOrchestrator:
+        orch = _CountingOrchestrator(orchestrator.WorkflowConfig(csv_path=self.csv_path))
+        self.assertTrue(self._run_workflow(orch, 'basic'))
+        return orch
+
+    def test_unchanged_input_is_cache_hit(self):
+        """Teste, dass ein zweiter Lauf mit gleicher CSV aus dem Cache kommt."""
+        first = self._run_basic()
+        first_profile = first.profil_json_path.read_bytes()
+        second = self._run_basic()
+
+        self.assertEqual(_CountingOrchestrator.compute_runs, 1)
+        self.assertEqual(second.profil_json_path.read_bytes(), first_profile)
+
+    def test_changed_csv_is_cache_miss(self):
+        """Teste, dass eine geänderte CSV neu berechnet wird."""
+        self._run_basic()
+        lines = self.csv_path.read_text(encoding="utf-8").splitlines()
+        first_row = lines[1]
+        value = first_row.rsplit(",", 1)[1]
+        lines[1] = first_row.rsplit(",", 1)[0] + ("," + ("1" if value != "1" else "2"))
+        self.csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        self._run_basic()
+
+        self.assertEqual(_CountingOrchestrator.compute_runs, 2)
+
+    def test_key_follows_loaded_module(self):
+        """Teste, dass der Key den geladenen Stand von auswertung.py nutzt, nicht die Datei."""
+        config = orchestrator.WorkflowConfig(csv_path=self.csv_path)
+        inproc = orchestrator.LernprofilOrchestrator(config)
+        isolated = orchestrator.LernprofilOrchestrator(config, isolate=True)
+        importlib.import_module('auswertung')
+
+        # Simuliert: auswertung.py wurde nach dem Import geändert
+        with mock.patch.dict(orchestrator._LOADED_SOURCE_MTIMES, {'auswertung': 1}):
+            self.assertNotEqual(inproc._compute_cache_dir(), isolated._compute_cache_dir())
+
+
+
+class TestSessionIndex(_WorkdirTestCase):
+    """Tests für den Session-Index."""
+
+    def test_repeated_workflow_gets_own_index(self):
+        """Teste, dass ein zweiter Workflow nur eigene Ergebnisse unter eigener ID schreibt."""
+        csv_path = Path("antworten.csv")
+        csv_path.write_bytes(EXAMPLE_CSV.read_bytes())
+        orch = orchestrator.LernprofilOrchestrator(orchestrator.WorkflowConfig(csv_path=csv_path))
+        self.assertTrue(self._run_workflow(orch, 'basic'))
+        first_session = orch.session_dir
+        self.assertTrue(self._run_workflow(orch, 'basic'))
+
+        self.assertNotEqual(orch.session_dir, first_session)
+        index = json.loads(orch.session_dir.with_suffix('.json').read_text(encoding="utf-8"))
+        self.assertEqual(index['session_id'], orch.session_dir.name)
+        self.assertEqual(len(index['stages']), 1)
+
+    def test_invalid_csv_is_recorded(self):
+        """Teste, dass eine abgelehnte CSV als fehlgeschlagene Berechnung im Index steht."""
+        csv_path = Path("kaputt.csv")
+        csv_path.write_text("frage,antwort\n1,9\n", encoding="utf-8")
+        orch = orchestrator.LernprofilOrchestrator(orchestrator.WorkflowConfig(csv_path=csv_path))
+        self.assertFalse(self._run_workflow(orch, 'basic'))
+
+        index = json.loads(orch.session_dir.with_suffix('.json').read_text(encoding="utf-8"))
+        [stage] = index['stages']
+        self.assertEqual(stage['name'], 'Profil-Berechnung')
+        self.assertFalse(stage['success'])
+        self.assertTrue(stage['error_message'])
+
+
+if __name__ == "__main__":
+    unittest.main()
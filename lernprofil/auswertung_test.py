@@ -10,30 +10,55 @@ Testet die Kernfunktionalität des Auswertungssystems:
 - Extremprofile
 """
 
+import math
+import os
 import unittest
 import sys
+from collections import Counter, defaultdict
 from pathlib import Path
 
 # Scoring-Modul importieren
 sys.path.insert(0, str(Path(__file__).parent))
 import auswertung as scoring
 
+# (Item-Code, Reverse-Flag) je Item, einmal beim Import ermittelt statt pro Test
+_REVERSE_FLAGS = tuple(
+    (code, item_def.reverse_scored) for code, item_def in scoring.ITEM_DEFINITIONS.items()
+)
+
+# Item-Codes in Instrument-Reihenfolge
+_ALL_CODES = tuple(scoring.ITEM_DEFINITIONS)
+
+# Kanonische neutrale Ratings (alle 3); Tests arbeiten immer auf einer .copy()
+_NEUTRAL_TEMPLATE = dict.fromkeys(_ALL_CODES, 3)
+
+# Aus ITEM_DEFINITIONS abgeleitete Filter, einmal beim Import berechnet
+_MAIN = tuple(item for item in scoring.ITEM_DEFINITIONS.values() if item.include_in_main_scale)
+_BY_DIM = defaultdict(list)
+for _item in _MAIN:
+    _BY_DIM[_item.dimension_code].append(_item)
+del _item
+
+
+def _scores_off_target(profile: dict, target: float, tolerance: float, dims=None) -> dict:
+    """Dimensions-Scores, die weiter als tolerance vom Zielwert entfernt liegen."""
+    dimensions = profile["dimensions"]
+    return {
+        dim: dimensions[dim]["score"] for dim in (dims or dimensions)
+        if not math.isclose(dimensions[dim]["score"], target, abs_tol=tolerance)
+    }
+
 
 class TestScoringBasics(unittest.TestCase):
     """Tests für grundlegende Scoring-Funktionen."""
     
     def test_reverse_likert_mapping(self):
         """Teste Reverse-Coding: 1<->5, 2<->4, 3->3."""
-        self.assertEqual(scoring.reverse_likert(1), 5)
-        self.assertEqual(scoring.reverse_likert(2), 4)
-        self.assertEqual(scoring.reverse_likert(3), 3)
-        self.assertEqual(scoring.reverse_likert(4), 2)
-        self.assertEqual(scoring.reverse_likert(5), 1)
+        self.assertEqual([scoring.reverse_likert(v) for v in range(1, 6)], [5, 4, 3, 2, 1])
         
-        with self.assertRaises(ValueError):
-            scoring.reverse_likert(0)
-        with self.assertRaises(ValueError):
-            scoring.reverse_likert(6)
+        for invalid in (0, 6):
+            with self.subTest(value=invalid), self.assertRaises(ValueError):
+                scoring.reverse_likert(invalid)
     
     def test_classify_score_thresholds(self):
         """Teste Kategorisierungs-Schwellenwerte."""
@@ -53,75 +78,63 @@ class TestExtremProfiles(unittest.TestCase):
         Erzeugt ein Rating-Dict für Extremprofile.
         Nach Reverse-Coding sollten alle Werte entweder minimal oder maximal sein.
         """
-        ratings = {}
-        for code, item_def in scoring.ITEM_DEFINITIONS.items():
-            if high:
-                # Nach Reverse-Coding soll hoher Wert entstehen
-                if item_def.reverse_scored:
-                    ratings[code] = scoring.LIKERT_MIN  # -> max nach Reverse
-                else:
-                    ratings[code] = scoring.LIKERT_MAX
-            else:
-                # Nach Reverse-Coding soll niedriger Wert entstehen
-                if item_def.reverse_scored:
-                    ratings[code] = scoring.LIKERT_MAX  # -> min nach Reverse
-                else:
-                    ratings[code] = scoring.LIKERT_MIN
-        return ratings
+        # (normal, reverse): Reverse-Items erhalten den Gegenwert,
+        # damit nach Reverse-Coding alle Items gleich ausfallen
+        if high:
+            value, reverse_value = scoring.LIKERT_MAX, scoring.LIKERT_MIN
+        else:
+            value, reverse_value = scoring.LIKERT_MIN, scoring.LIKERT_MAX
+        return {code: reverse_value if reverse else value for code, reverse in _REVERSE_FLAGS}
     
     def test_all_low_scores_result_in_zero(self):
         """Teste, dass alle minimalen Antworten Score von 0 ergeben."""
         ratings = self._make_ratings_for_extreme_profile(high=False)
         profile = scoring.compute_profile(ratings, profile_id="low_profile")
         
-        for dim_code, dim in profile["dimensions"].items():
-            self.assertAlmostEqual(0.0, dim["score"], places=1, 
-                                 msg=f"Dimension {dim_code} nicht bei 0")
+        self.assertEqual({}, _scores_off_target(profile, 0.0, 0.05),
+                         "Dimensionen nicht bei 0")
     
     def test_all_high_scores_result_in_hundred(self):
         """Teste, dass alle maximalen Antworten Score von 100 ergeben."""
         ratings = self._make_ratings_for_extreme_profile(high=True)
         profile = scoring.compute_profile(ratings, profile_id="high_profile")
         
-        for dim_code, dim in profile["dimensions"].items():
-            self.assertAlmostEqual(100.0, dim["score"], places=1,
-                                 msg=f"Dimension {dim_code} nicht bei 100")
+        self.assertEqual({}, _scores_off_target(profile, 100.0, 0.05),
+                         "Dimensionen nicht bei 100")
 
 
 class TestChronotype(unittest.TestCase):
     """Tests für Chronotyp-Berechnung."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Neutrales Ergebnis einmal pro Klasse berechnen
+        cls.neutral_ratings = _NEUTRAL_TEMPLATE.copy()
+        cls.neutral_chrono = scoring.compute_chronotype_index(cls.neutral_ratings)
+        
+        # Morgen-Items hoch, Abend-Items niedrig; Abendtyp ist das Spiegelbild
+        cls.morning = {
+            **cls.neutral_ratings,
+            **dict.fromkeys(("A8", "A13", "A14", "A15"), 5),
+            **dict.fromkeys(("A9", "A16"), 1),
+        }
+        cls.evening = {code: 6 - value for code, value in cls.morning.items()}
+    
     def test_clear_morning_type(self):
         """Teste eindeutigen Morgentyp."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-        # Morgen-Items hoch, Abend-Items niedrig
-        for code in ["A8", "A13", "A14", "A15"]:
-            ratings[code] = 5
-        for code in ["A9", "A16"]:
-            ratings[code] = 1
-        
-        chronotype = scoring.compute_chronotype_index(ratings)
+        chronotype = scoring.compute_chronotype_index(self.morning)
         self.assertLess(chronotype["balance_score"], -0.8)
         self.assertIn("Morgentyp", chronotype["interpretation"])
     
     def test_clear_evening_type(self):
         """Teste eindeutigen Abendtyp."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-        # Morgen-Items niedrig, Abend-Items hoch
-        for code in ["A8", "A13", "A14", "A15"]:
-            ratings[code] = 1
-        for code in ["A9", "A16"]:
-            ratings[code] = 5
-        
-        chronotype = scoring.compute_chronotype_index(ratings)
+        chronotype = scoring.compute_chronotype_index(self.evening)
         self.assertGreater(chronotype["balance_score"], 0.8)
         self.assertIn("Abendtyp", chronotype["interpretation"])
     
     def test_neutral_chronotype(self):
         """Teste neutralen Chronotyp."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-        
-        chronotype = scoring.compute_chronotype_index(ratings)
+        chronotype = self.neutral_chrono
         self.assertAlmostEqual(chronotype["balance_score"], 0.0, delta=0.1)
         self.assertIn("Neutral", chronotype["interpretation"])
 
@@ -131,7 +144,7 @@ class TestResponseQuality(unittest.TestCase):
     
     def test_straight_lining_detection(self):
         """Teste Erkennung von Straight-Lining (nur eine Antwort)."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
+        ratings = _NEUTRAL_TEMPLATE.copy()
         quality = scoring.check_response_quality(ratings)
         
         self.assertEqual(quality["num_unique_responses"], 1)
@@ -159,12 +172,11 @@ class TestDimensionalIndependence(unittest.TestCase):
         Teste, dass Änderungen in einer Dimension andere nicht beeinflussen.
         """
         # Basis-Profil mit neutralen Werten
-        base_ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
+        base_ratings = _NEUTRAL_TEMPLATE.copy()
         
         # Setze nur Aufmerksamkeits-Items auf Maximum
-        for code, item_def in scoring.ITEM_DEFINITIONS.items():
-            if item_def.dimension_code == "attention" and item_def.include_in_main_scale:
-                base_ratings[code] = 5 if not item_def.reverse_scored else 1
+        for item_def in _BY_DIM["attention"]:
+            base_ratings[item_def.code] = 5 if not item_def.reverse_scored else 1
         
         profile = scoring.compute_profile(base_ratings)
         
@@ -172,128 +184,94 @@ class TestDimensionalIndependence(unittest.TestCase):
         self.assertGreater(profile["dimensions"]["attention"]["score"], 90)
         
         # Andere Dimensionen sollten bei ~50 bleiben (3 auf Likert → 50 auf 0-100)
-        for dim in ["sensory", "social", "executive", "motivation", "regulation"]:
-            score = profile["dimensions"][dim]["score"]
-            self.assertAlmostEqual(score, 50.0, delta=10.0,
-                                 msg=f"Dimension {dim} sollte neutral bleiben, ist aber {score}")
+        others = ["sensory", "social", "executive", "motivation", "regulation"]
+        self.assertEqual({}, _scores_off_target(profile, 50.0, 10.0, others),
+                         "Dimensionen sollten neutral bleiben")
 
 
 class TestRatingValidation(unittest.TestCase):
     """Tests für validate_ratings Funktion."""
     
-    def test_missing_items_raises(self):
-        """Teste, dass fehlende Items einen ValueError werfen."""
-        ratings = {code: 3 for code in list(scoring.ITEM_DEFINITIONS.keys())[:-1]}
-        with self.assertRaises(ValueError) as ctx:
-            scoring.validate_ratings(ratings)
-        self.assertIn("Fehlende Items", str(ctx.exception))
-
-    def test_extra_items_raises(self):
-        """Teste, dass extra Items einen ValueError werfen."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-        ratings["XXX"] = 3
-        with self.assertRaises(ValueError) as ctx:
-            scoring.validate_ratings(ratings)
-        self.assertIn("Unbekannte Items", str(ctx.exception))
-
-    def test_invalid_type_raises(self):
-        """Teste, dass nicht-int Werte einen TypeError werfen."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-        some_code = next(iter(ratings))
-        ratings[some_code] = "3"
-        with self.assertRaises(TypeError) as ctx:
-            scoring.validate_ratings(ratings)
-        self.assertIn("kein int", str(ctx.exception))
-    
-    def test_out_of_range_raises(self):
-        """Teste, dass Werte außerhalb 1-5 einen ValueError werfen."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-        some_code = next(iter(ratings))
-        ratings[some_code] = 6
-        with self.assertRaises(ValueError) as ctx:
-            scoring.validate_ratings(ratings)
-        self.assertIn("außerhalb des erlaubten Bereichs", str(ctx.exception))
+    def test_invalid_ratings_raise(self):
+        """Teste, dass fehlende, extra, nicht-int und ungültige Werte abgelehnt werden."""
+        neutral = _NEUTRAL_TEMPLATE.copy()
+        some_code = _ALL_CODES[0]
+        cases = [
+            (dict.fromkeys(_ALL_CODES[:-1], 3), ValueError, "Fehlende Items"),
+            ({**neutral, "XXX": 3}, ValueError, "Unbekannte Items"),
+            ({**neutral, some_code: "3"}, TypeError, "kein int"),
+            ({**neutral, some_code: 6}, ValueError, "außerhalb des erlaubten Bereichs"),
+        ]
+        for ratings, exc_type, message in cases:
+            with self.subTest(message=message):
+                with self.assertRaises(exc_type) as ctx:
+                    scoring.validate_ratings(ratings)
+                self.assertIn(message, str(ctx.exception))
     
     def test_valid_ratings_pass(self):
         """Teste, dass valide Ratings keine Exception werfen."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
+        ratings = _NEUTRAL_TEMPLATE.copy()
         try:
             scoring.validate_ratings(ratings)
         except Exception as e:
             self.fail(f"validate_ratings sollte nicht fehlschlagen bei validen Ratings: {e}")
 
 
-class TestItemCounts(unittest.TestCase):
-    """Tests für dimensionale Unabhängigkeit."""
-    
-    def test_manipulation_only_affects_target_dimension(self):
-        """
-        Teste, dass Änderungen in einer Dimension andere nicht beeinflussen.
-        """
-        # Basis-Profil mit neutralen Werten
-        base_ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-        
-        # Setze nur Aufmerksamkeits-Items auf Maximum
-        for code, item_def in scoring.ITEM_DEFINITIONS.items():
-            if item_def.dimension_code == "attention" and item_def.include_in_main_scale:
-                base_ratings[code] = 5 if not item_def.reverse_scored else 1
-        
-        profile = scoring.compute_profile(base_ratings)
-        
-        # Aufmerksamkeit sollte hoch sein
-        self.assertGreater(profile["dimensions"]["attention"]["score"], 90)
-        
-        # Andere Dimensionen sollten bei ~50 bleiben (3 auf Likert → 50 auf 0-100)
-        for dim in ["sensory", "social", "executive", "motivation", "regulation"]:
-            score = profile["dimensions"][dim]["score"]
-            self.assertAlmostEqual(score, 50.0, delta=10.0,
-                                 msg=f"Dimension {dim} sollte neutral bleiben, ist aber {score}")
-
-
 class TestItemCounts(unittest.TestCase):
     """Tests für korrekte Item-Zählungen."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Ein Durchlauf über alle Items, Schlüssel: (Hauptskala, Reverse, Dimension)
+        cls.tally = Counter(
+            (item.include_in_main_scale, item.reverse_scored, item.dimension_code)
+            for item in scoring.ITEM_DEFINITIONS.values()
+        )
+    
+    def _count(self, main=None, reverse=None, dimension=None) -> int:
+        """Summiert die Zählung über alle Schlüssel, die den Filtern entsprechen."""
+        return sum(
+            n for (is_main, is_reverse, dim), n in self.tally.items()
+            if main in (None, is_main)
+            and reverse in (None, is_reverse)
+            and dimension in (None, dim)
+        )
+    
     def test_total_item_count(self):
         """Teste Gesamt-Itemzahl: 88 Items."""
         self.assertEqual(len(scoring.ITEM_DEFINITIONS), 88)
+        self.assertEqual(self._count(), 88)
     
     def test_main_scale_items(self):
         """Teste Haupt-Skalen-Items: 80 Items."""
-        main_items = [item for item in scoring.ITEM_DEFINITIONS.values() 
-                     if item.include_in_main_scale]
-        self.assertEqual(len(main_items), 80)
+        self.assertEqual(self._count(main=True), 80)
     
     def test_separate_index_items(self):
         """Teste separate Index-Items: 8 Items."""
-        separate_items = [item for item in scoring.ITEM_DEFINITIONS.values() 
-                         if not item.include_in_main_scale]
-        self.assertEqual(len(separate_items), 8)
+        self.assertEqual(self._count(main=False), 8)
     
     def test_reverse_item_count(self):
         """Teste Reverse-Items in Hauptskalen: 27 Items."""
-        reverse_main = [item for item in scoring.ITEM_DEFINITIONS.values() 
-                       if item.include_in_main_scale and item.reverse_scored]
-        self.assertEqual(len(reverse_main), 27)
+        self.assertEqual(self._count(main=True, reverse=True), 27)
     
     def test_motivation_has_reverse_items(self):
         """Teste, dass Motivation mindestens 4 Reverse-Items hat (Fix von v0.1)."""
-        motivation_reverse = [item for item in scoring.ITEM_DEFINITIONS.values() 
-                             if item.dimension_code == "motivation" 
-                             and item.include_in_main_scale 
-                             and item.reverse_scored]
-        self.assertGreaterEqual(len(motivation_reverse), 4,
+        self.assertGreaterEqual(self._count(main=True, reverse=True, dimension="motivation"), 4,
                                "Motivation sollte mindestens 4 Reverse-Items haben")
 
 
 class TestMetadataConsistency(unittest.TestCase):
     """Tests für Konsistenz der Metadaten."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Neutrales Profil einmal pro Klasse berechnen
+        cls.neutral_ratings = _NEUTRAL_TEMPLATE.copy()
+        cls.neutral_profile = scoring.compute_profile(cls.neutral_ratings)
+    
     def test_profile_metadata_accurate(self):
         """Teste, dass Profil-Metadaten korrekt sind."""
-        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-        profile = scoring.compute_profile(ratings)
-        
-        meta = profile["meta"]
+        meta = self.neutral_profile["meta"]
         self.assertEqual(meta["version"], "0.2.1")
         self.assertEqual(meta["num_items_instrument"], 88)
         self.assertEqual(meta["num_items_answered"], 88)
@@ -303,24 +281,16 @@ class TestMetadataConsistency(unittest.TestCase):
 
 
 def run_tests():
-    """Führe alle Tests aus und gebe Zusammenfassung aus."""
-    # Test-Suite erstellen
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Alle Test-Klassen hinzufügen
-    suite.addTests(loader.loadTestsFromTestCase(TestScoringBasics))
-    suite.addTests(loader.loadTestsFromTestCase(TestExtremProfiles))
-    suite.addTests(loader.loadTestsFromTestCase(TestChronotype))
-    suite.addTests(loader.loadTestsFromTestCase(TestResponseQuality))
-    suite.addTests(loader.loadTestsFromTestCase(TestDimensionalIndependence))
-    suite.addTests(loader.loadTestsFromTestCase(TestRatingValidation))
-    suite.addTests(loader.loadTestsFromTestCase(TestItemCounts))
-    suite.addTests(loader.loadTestsFromTestCase(TestMetadataConsistency))
+    """
+    Führe alle Tests aus und gebe Zusammenfassung aus.
     
-    # Tests ausführen
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    Ausführliche Ausgabe pro Test mit -v oder VERBOSE=1.
+    """
+    # Alle Test-Klassen dieses Moduls ausführen
+    verbosity = 2 if os.environ.get("VERBOSE", "") not in ("", "0") else 1
+    result = unittest.main(
+        module=sys.modules[__name__], verbosity=verbosity, exit=False
+    ).result
     
     # Zusammenfassung
     print("\n" + "=" * 70)
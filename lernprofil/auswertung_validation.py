@@ -59,7 +59,7 @@ except (ValueError, RuntimeError):
     print("✅ Chronotyp: Defensive Fehlerbehandlung aktiv")
 
 # 1.5 Tests
-print("✅ Test-Suite: 21 Tests (siehe test_scoring_v02.py)")
+print("✅ Test-Suite: 18 Tests (siehe test_scoring_v02.py)")
 
 print()
 
@@ -49,7 +49,7 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import sys
 from datetime import datetime
 
@@ -519,7 +519,7 @@ def visualize_profile(profile_path: Path, output_dir: Path) -> None:
 # CLI
 # ---------------------------------------------------------------------------
 
-def main():
+def main(argv: Optional[List[str]] = None) -> None:
     parser = argparse.ArgumentParser(
         description="Erstellt Visualisierungen für ein Lernenergie-Profil (Version 0.2.1)"
     )
@@ -536,7 +536,7 @@ def main():
         help="Output-Verzeichnis für Visualisierungen (Standard: ./charts)",
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.profile_json.exists():
         print(f"❌ Profil-Datei nicht gefunden: {args.profile_json}", file=sys.stderr)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lernprofil-Worker - Stage-Ausführung ohne Interpreter-Neustart
+==============================================================
+
+Führt die Auswertungs-Scripts (auswertung.py, auswertung_visualize.py,
+auswertung_test.py, auswertung_validation.py) im laufenden Python-Prozess aus
+und leitet deren stdout/stderr direkt in Log-Dateien.
+
+Wird auf zwei Arten genutzt:
+- vom Orchestrator direkt importiert (In-Process-Modus, Standard)
+- als langlebiger Worker-Prozess pro Script (Orchestrator mit --workers)
+
+WORKER-PROTOKOLL
+----------------
+Der Worker liest Jobs zeilenweise als JSON von stdin und antwortet pro Job
+mit genau einer JSON-Zeile auf stdout:
+
+    → {"argv": ["antworten.csv", "--quiet"], "stdout": "log/out.txt", "stderr": "log/err.txt"}
+    ← {"returncode": 0}
+
+Die Module werden beim ersten Job importiert und bleiben danach geladen.
+Der Worker beendet sich, sobald stdin geschlossen wird.
+
+AUFRUF
+------
+python -u auswertung_worker.py auswertung /pfad/zu/auswertung.py
+"""
+
+import importlib
+import json
+import runpy
+import sys
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import List, Optional
+
+
+# sys.argv, sys.stdout und sys.stderr sind prozessweit - Jobs dürfen
+# deshalb nie gleichzeitig laufen
+_INPROC_LOCK = threading.Lock()
+
+
+def _exit_code(exc: SystemExit) -> int:
+    """Übersetzt SystemExit in einen Returncode wie der Python-Interpreter."""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _call_entrypoint(script_key: str, script_path: Path, argv: List[str]) -> Optional[int]:
+    """Ruft den Einstiegspunkt eines Scripts im laufenden Prozess auf."""
+    if script_key == 'auswertung':
+        return importlib.import_module('auswertung').main(argv)
+    if script_key == 'visualize':
+        return importlib.import_module('auswertung_visualize').main(argv)
+    if script_key == 'test':
+        return importlib.import_module('auswertung_test').run_tests()
+
+    # auswertung_validation.py ist ein reines Script ohne main()
+    runpy.run_path(str(script_path), run_name='__main__')
+    return None
+
+
+def run_job(script_key: str, script_path: Path, argv: List[str],
+            stdout_path: Path, stderr_path: Path) -> int:
+    """
+    Führt ein Script im laufenden Prozess aus.
+
+    stdout/stderr werden direkt in die Log-Dateien geschrieben, der
+    Speicherbedarf bleibt unabhängig vom Log-Umfang.
+
+    Returns:
+        Returncode wie bei einem Subprocess
+    """
+    script_dir = str(Path(script_path).parent)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+    with _INPROC_LOCK, \
+            open(stdout_path, 'w', encoding='utf-8') as out, \
+            open(stderr_path, 'w', encoding='utf-8') as err, \
+            redirect_stdout(out), redirect_stderr(err):
+        saved_argv = sys.argv
+        sys.argv = [str(script_path), *argv]
+        try:
+            rc = _call_entrypoint(script_key, Path(script_path), argv)
+            returncode = rc if isinstance(rc, int) else 0
+        except SystemExit as exc:
+            returncode = _exit_code(exc)
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            sys.argv = saved_argv
+
+    return returncode
+
+
+def serve(script_key: str, script_path: Path) -> None:
+    """Bearbeitet Jobs von stdin, bis stdin geschlossen wird."""
+    # stdout ist ab jetzt reserviert für das Protokoll; Streu-Ausgaben
+    # außerhalb eines Jobs landen auf stderr
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        returncode = run_job(
+            script_key, script_path, job['argv'], Path(job['stdout']), Path(job['stderr'])
+        )
+        protocol.write(json.dumps({'returncode': returncode}) + '\n')
+        protocol.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
+        print("Aufruf: auswertung_worker.py SCRIPT_KEY SCRIPT_PATH", file=sys.stderr)
+        return 2
+
+    serve(args[0], Path(args[1]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())